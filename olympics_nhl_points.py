@@ -7,13 +7,20 @@ maps players to their NHL teams, and ranks NHL teams by total Olympic points.
 """
 
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+import jinja2
+import lxml.html
+from lxml import etree
 import unicodedata
-from collections import defaultdict
+from functools import lru_cache
 import sys
 import time
 import json
-from datetime import datetime
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 
 # NHL team abbreviations (all 32 teams)
@@ -24,8 +31,13 @@ NHL_TEAMS = [
     'WPG', 'WSH'
 ]
 
+# Number of concurrent requests when fanning out over teams/countries
+MAX_FETCH_WORKERS = 16
+
 # Browser headers to mimic a real browser request
 # Note: Accept-Encoding is omitted - requests handles compression automatically
+# Note: Cache-Control is omitted - requests-cache honors a request's max-age=0 over
+# CACHE_EXPIRE_AFTER, which would force every fetch back to the network
 BROWSER_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
@@ -37,14 +49,46 @@ BROWSER_HEADERS = {
     'Sec-Fetch-Mode': 'navigate',
     'Sec-Fetch-Site': 'none',
     'Sec-Fetch-User': '?1',
-    'Cache-Control': 'max-age=0',
 }
 
+# How long cached responses stay fresh, per host (rosters change far less often than live results)
+CACHE_EXPIRE_AFTER = {
+    'api-web.nhle.com': timedelta(days=1),
+    '*.quanthockey.com': timedelta(hours=1),
+    '*.olympics.com': timedelta(minutes=5),
+}
+
+# Shared session so repeated requests to the same host reuse pooled keep-alive connections,
+# backed by an on-disk HTTP cache so reruns skip unchanged pages
+_SESSION = requests_cache.CachedSession(
+    'olympics_nhl_cache',
+    backend='sqlite',
+    expire_after=timedelta(hours=6),
+    urls_expire_after=CACHE_EXPIRE_AFTER,
+)
+_SESSION.headers.update(BROWSER_HEADERS)
+_ADAPTER = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+
+
+class _CombiningMarkTable(dict):
+    """str.translate table that deletes combining marks, filled in lazily per codepoint."""
+    
+    def __missing__(self, codepoint):
+        value = None if unicodedata.category(chr(codepoint)) == 'Mn' else codepoint
+        self[codepoint] = value
+        return value
+
 
+_COMBINING_MARKS = _CombiningMarkTable()
+
+
+@lru_cache(maxsize=4096)
 def normalize_name(name):
     """
     Normalize a player name for matching.
-    - Converts to lowercase
+    - Converts to lowercase (casefold)
     - Removes accents/diacritics
     - Standardizes whitespace
     
@@ -54,11 +98,14 @@ def normalize_name(name):
     Returns:
         Normalized name (e.g., "connor mcdavid")
     """
-    # Normalize unicode to decomposed form, then filter out combining characters
-    name = unicodedata.normalize('NFD', name)
-    name = ''.join(char for char in name if unicodedata.category(char) != 'Mn')
+    # Most names are plain ASCII and have no diacritics to strip
+    if name.isascii():
+        return ' '.join(name.lower().split())
+    
+    # Normalize unicode to decomposed form, then drop combining characters in one pass
+    name = unicodedata.normalize('NFD', name).translate(_COMBINING_MARKS)
     # Convert to lowercase and standardize whitespace
-    return ' '.join(name.lower().split())
+    return ' '.join(name.casefold().split())
 
 
 def fetch_with_retry(url, params=None, max_retries=3, timeout=45, extra_headers=None):
@@ -70,18 +117,14 @@ def fetch_with_retry(url, params=None, max_retries=3, timeout=45, extra_headers=
         params: Query parameters
         max_retries: Maximum number of retries
         timeout: Request timeout in seconds
-        extra_headers: Additional headers to merge with browser headers
+        extra_headers: Additional headers to merge with the session's browser headers
     
     Returns:
         Response object
     """
-    headers = BROWSER_HEADERS.copy()
-    if extra_headers:
-        headers.update(extra_headers)
-    
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=timeout)
+            response = _SESSION.get(url, params=params, headers=extra_headers, timeout=timeout)
             response.raise_for_status()
             return response
         except (requests.RequestException, Exception) as e:
@@ -125,6 +168,23 @@ COUNTRY_NAMES = {
 }
 
 
+# Only the stats tables matter on Quanthockey pages; skip building the rest of the DOM
+_TABLES_ONLY = SoupStrainer('table')
+
+
+def _cell_text(cell):
+    """Return a table cell's stripped text, skipping the get_text() walk for single-string cells."""
+    text = cell.string
+    if text is None:
+        return cell.get_text(strip=True)
+    return text.strip()
+
+
+def _to_int(text):
+    """Parse a stat cell as a non-negative integer, treating blanks and dashes as 0."""
+    return int(text) if text.isdecimal() else 0
+
+
 def fetch_quanthockey_stats(country_code):
     """
     Fetch player stats from Quanthockey for a specific Olympic team.
@@ -133,62 +193,47 @@ def fetch_quanthockey_stats(country_code):
         country_code: Country code (e.g., 'canada', 'usa', 'sweden')
     
     Returns:
-        List of dicts with player stats (name, goals, assists, points, country)
+        List of (normalized_name, name, goals, assists) tuples for players with points
     """
     url = f"https://www.quanthockey.com/olympics/en/teams/team-{country_code}-players-2026-olympics-stats.html"
     
     try:
         response = fetch_with_retry(url, timeout=30, max_retries=2)
     except Exception as e:
-        print(f"    Error: {str(e)[:100]}")
+        print(f"  {country_code.title()}: Error: {str(e)[:100]}")
         return []
     
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(response.content, 'lxml', parse_only=_TABLES_ONLY)
     players = []
     
     # Find the stats table
     tables = soup.find_all('table')
-    print(f"    Found {len(tables)} table(s)")
     for table in tables:
         rows = table.find_all('tr')
         
         for row in rows[2:]:  # Skip first two header rows
             cols = row.find_all(['td', 'th'])  # Some cells are th, some are td
             if len(cols) >= 9:  # Need at least rank, name, team, age, pos, GP, G, A, P
-                try:
-                    # Column indices: 0=Rank, 1=(blank), 2=Name (with link), 3=Team, 4=Age, 5=Pos, 6=GP, 7=G, 8=A, 9=P
-                    name_cell = cols[2]
+                # Column indices: 0=Rank, 1=(blank), 2=Name (with link), 3=Team, 4=Age, 5=Pos, 6=GP, 7=G, 8=A, 9=P
+                name_cell = cols[2]
+                name_text = name_cell.string  # Set when the cell holds just the name (usually a single link)
+                if name_text is not None:
+                    player_name = name_text.strip()
+                else:
                     name_link = name_cell.find('a')
-                    if name_link:
-                        player_name = name_link.get_text(strip=True)
-                    else:
-                        player_name = name_cell.get_text(strip=True)
-                    
-                    # Skip if no name
-                    if not player_name:
-                        continue
-                    
-                    goals_text = cols[7].get_text(strip=True)
-                    assists_text = cols[8].get_text(strip=True)
-                    
-                    goals = int(goals_text) if goals_text and goals_text.isdigit() else 0
-                    assists = int(assists_text) if assists_text and assists_text.isdigit() else 0
-                    points = goals + assists
-                    
-                    if points > 0:  # Only include players with points
-                        players.append({
-                            'name': player_name,
-                            'goals': goals,
-                            'assists': assists,
-                            'points': points,
-                            'country': country_code,
-                            'country_flag': COUNTRY_FLAGS.get(country_code, ''),
-                            'country_name': COUNTRY_NAMES.get(country_code, country_code.title()),
-                        })
-                except (ValueError, IndexError) as e:
+                    player_name = (name_link or name_cell).get_text(strip=True)
+                
+                # Skip if no name
+                if not player_name:
                     continue
+                
+                goals = _to_int(_cell_text(cols[7]))
+                assists = _to_int(_cell_text(cols[8]))
+                
+                if goals + assists > 0:  # Only include players with points
+                    players.append((normalize_name(player_name), player_name, goals, assists))
     
-    print(f"    Parsed {len(players)} players with points")
+    print(f"  {country_code.title()}: found {len(tables)} table(s), parsed {len(players)} players with points")
     return players
 
 
@@ -221,7 +266,7 @@ def fetch_olympic_games():
     
     try:
         response = fetch_with_retry(url, params=params, extra_headers=api_headers)
-        data = response.json()
+        data = orjson.loads(response.content)
     except Exception as e:
         print(f"Warning: Could not fetch games from API: {e}")
         print("Using hardcoded game list from latest known data...")
@@ -250,6 +295,46 @@ def fetch_olympic_games():
     return games
 
 
+def _bump(counts, name, index):
+    """Increment a player's [goals, assists] counter at the given index."""
+    entry = counts.get(name)
+    if entry is None:
+        counts[name] = entry = [0, 0]
+    entry[index] += 1
+
+
+# Precompiled XPath queries for play-by-play pages
+# Athlete links look like href="/en/milano-cortina-2026/results/athlete-details/{athleteCode}"
+_ATHLETE_LINKS = etree.XPath(".//a[contains(@href, '/athlete-details/')]")
+# "Goal" text nodes in document order, ignoring script/style payloads (e.g. embedded JSON)
+_GOAL_TEXTS = etree.XPath(
+    "//text()[contains(., 'Goal')][not(parent::script or parent::style)]"
+)
+# From a text node's parent element, the nearest element at most 10 levels up that contains athlete links
+_GOAL_CONTAINER = etree.XPath(
+    "ancestor-or-self::*[position() <= 10][.//a[contains(@href, '/athlete-details/')]][1]"
+)
+# Whether any text node in a container mentions an assist (stops at the first match)
+_HAS_ASSIST_TEXT = etree.XPath(
+    "boolean(.//text()[contains(., 'Assist') or contains(., 'assist')])"
+)
+
+
+def _declared_charset(response):
+    """Return the charset from the response's Content-Type header, or None if none is declared."""
+    content_type = response.headers.get('Content-Type', '')
+    for param in content_type.split(';')[1:]:
+        key, _, value = param.partition('=')
+        if key.strip().lower() == 'charset':
+            return value.strip().strip('"\'') or None
+    return None
+
+
+def _link_text(link):
+    """Join a link's stripped text nodes, like BeautifulSoup's get_text(strip=True)."""
+    return ''.join(text.strip() for text in link.itertext())
+
+
 def parse_play_by_play(phase_code, event_unit_code):
     """
     Scrape a play-by-play page to extract goals and assists.
@@ -274,87 +359,111 @@ def parse_play_by_play(phase_code, event_unit_code):
         print(f"  Warning: Could not fetch {phase_code}/{event_unit_code}: {str(e)[:100]}")
         return {}
     
-    soup = BeautifulSoup(response.text, 'html.parser')
+    # Decode with the charset the server declared; without one, lxml falls back to the page's meta tag
+    charset = _declared_charset(response)
+    try:
+        parser = lxml.html.HTMLParser(encoding=charset) if charset else None
+    except LookupError:
+        parser = None  # Unknown charset name
     
-    player_stats = defaultdict(lambda: {'goals': 0, 'assists': 0})
+    try:
+        tree = lxml.html.fromstring(response.content, parser=parser)
+    except etree.ParserError as e:
+        # Raised for empty bodies ("Document is empty")
+        print(f"  Warning: Could not parse {phase_code}/{event_unit_code}: {str(e)[:100]}")
+        return {}
+    
+    player_stats = {}  # name -> [goals, assists]
     seen_events = set()  # To deduplicate events (shown twice on page)
     
     # Find all goal events
     # Goals are in divs or sections with text containing "Goal"
-    # The structure has athlete links with href="/en/milano-cortina-2026/results/athlete-details/{athleteCode}"
-    
-    # Look for all text nodes containing "Goal"
-    for element in soup.find_all(string=lambda text: text and 'Goal' in text):
-        parent = element.parent
+    for text in _GOAL_TEXTS(tree):
+        # A tail text node hangs off its preceding sibling; its real parent is one level up
+        parent = text.getparent()
+        if text.is_tail:
+            parent = parent.getparent()
+        if parent is None:
+            continue
         
         # Navigate up to find the container with player links
-        for _ in range(10):  # Search up the tree
-            if not parent:
-                break
-            
-            # Find athlete links in this container
-            athlete_links = parent.find_all('a', href=lambda x: x and '/athlete-details/' in x)
-            
-            if athlete_links and len(athlete_links) >= 1:
-                # First link is the goal scorer
-                scorer_link = athlete_links[0]
-                scorer_name = scorer_link.get_text(strip=True)
-                scorer_code = scorer_link.get('href', '').split('/')[-1]
-                
-                # Create unique event ID
-                event_id = f"{scorer_code}_{scorer_name}"
-                
-                if event_id not in seen_events:
-                    seen_events.add(event_id)
-                    player_stats[scorer_name]['goals'] += 1
-                    
-                    # Additional links are assisters
-                    for assist_link in athlete_links[1:]:
-                        assister_name = assist_link.get_text(strip=True)
-                        # Check if this is actually an assist (look for "Assist" text nearby)
-                        assist_context = str(parent)
-                        if 'Assist' in assist_context or 'assist' in assist_context:
-                            player_stats[assister_name]['assists'] += 1
-                
-                break  # Found the container, no need to go higher
+        containers = _GOAL_CONTAINER(parent)
+        if not containers:
+            continue
+        container = containers[0]
+        athlete_links = _ATHLETE_LINKS(container)
+        
+        # First link is the goal scorer
+        scorer_link = athlete_links[0]
+        scorer_name = _link_text(scorer_link)
+        scorer_code = scorer_link.get('href', '').split('/')[-1]
+        
+        # Create unique event ID
+        event_id = (scorer_code, scorer_name)
+        
+        if event_id not in seen_events:
+            seen_events.add(event_id)
+            _bump(player_stats, scorer_name, 0)
             
-            parent = parent.parent
+            # Additional links are assisters (if "Assist" text appears in the container)
+            if len(athlete_links) > 1 and _HAS_ASSIST_TEXT(container):
+                for assist_link in athlete_links[1:]:
+                    assister_name = _link_text(assist_link)
+                    _bump(player_stats, assister_name, 1)
     
-    return dict(player_stats)
+    return {name: {'goals': goals, 'assists': assists} for name, (goals, assists) in player_stats.items()}
 
 
-def fetch_nhl_rosters():
+def _fetch_roster(team_abbrev):
     """
-    Fetch all NHL team rosters and build a name->team mapping.
+    Fetch the current roster for a single NHL team.
+    
+    Args:
+        team_abbrev: NHL team abbreviation (e.g., 'EDM')
+    
+    Returns:
+        Tuple of (team_abbrev, roster dict), with None as the roster if the fetch failed
+    """
+    url = f"https://api-web.nhle.com/v1/roster/{team_abbrev}/current"
+    
+    try:
+        response = fetch_with_retry(url, timeout=15, max_retries=2)
+        return team_abbrev, orjson.loads(response.content)
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        print(f"  Warning: Could not fetch roster for {team_abbrev}: {e}")
+        return team_abbrev, None
+
+
+def _build_player_to_team(rosters):
+    """
+    Build a name->team mapping from fetched NHL rosters.
+    
+    Args:
+        rosters: Iterable of (team_abbrev, roster dict or None) tuples, as returned by _fetch_roster
     
     Returns:
         Dict mapping normalized player name to NHL team abbreviation
     """
     player_to_team = {}
     
-    print("\nFetching NHL rosters...")
-    for team_abbrev in NHL_TEAMS:
-        url = f"https://api-web.nhle.com/v1/roster/{team_abbrev}/current"
+    for team_abbrev, roster in rosters:
+        if roster is None:
+            continue
         
-        try:
-            response = fetch_with_retry(url, timeout=15, max_retries=2)
-            roster = response.json()
-            
-            # Process forwards, defensemen, and goalies
-            for position_group in ['forwards', 'defensemen', 'goalies']:
-                for player in roster.get(position_group, []):
-                    first_name = player.get('firstName', {}).get('default', '')
-                    last_name = player.get('lastName', {}).get('default', '')
-                    
-                    if first_name and last_name:
-                        full_name = f"{first_name} {last_name}"
-                        normalized = normalize_name(full_name)
-                        player_to_team[normalized] = team_abbrev
-            
-            print(f"  {team_abbrev}: {len(roster.get('forwards', [])) + len(roster.get('defensemen', [])) + len(roster.get('goalies', []))} players")
+        # Process forwards, defensemen, and goalies
+        for position_group in ['forwards', 'defensemen', 'goalies']:
+            for player in roster.get(position_group, []):
+                first = player.get('firstName')
+                last = player.get('lastName')
+                first_name = first.get('default', '') if first else ''
+                last_name = last.get('default', '') if last else ''
+                
+                if first_name and last_name:
+                    full_name = f"{first_name} {last_name}"
+                    normalized = normalize_name(full_name)
+                    player_to_team[normalized] = team_abbrev
         
-        except requests.RequestException as e:
-            print(f"  Warning: Could not fetch roster for {team_abbrev}: {e}")
+        print(f"  {team_abbrev}: {len(roster.get('forwards', [])) + len(roster.get('defensemen', [])) + len(roster.get('goalies', []))} players")
     
     print(f"Total NHL players mapped: {len(player_to_team)}")
     return player_to_team
@@ -374,44 +483,47 @@ def main():
         'france', 'italy'
     ]
     
-    # Step 1: Fetch stats from Quanthockey
-    print("\nFetching Olympic player stats from Quanthockey...")
+    # Steps 1 and 2 fetch independent data, so queue both fan-outs on one pool
+    # before waiting on either; total fetch time is the slower stage, not the sum
+    print("\nFetching Olympic player stats from Quanthockey and NHL rosters...")
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        country_results = executor.map(fetch_quanthockey_stats, olympic_countries)
+        roster_results = executor.map(_fetch_roster, NHL_TEAMS)
+        country_players = list(country_results)
+        rosters = list(roster_results)
+    
+    # Step 1: Merge stats from Quanthockey
     all_player_stats = {}
     
-    for country in olympic_countries:
-        print(f"  {country.title()}...")
-        players = fetch_quanthockey_stats(country)
-        
-        for player in players:
-            # Use normalized name as key to avoid duplicates
-            name_key = normalize_name(player['name'])
-            if name_key not in all_player_stats:
-                all_player_stats[name_key] = {
-                    'name': player['name'],
-                    'goals': player['goals'],
-                    'assists': player['assists'],
-                    'country': player['country'],
-                    'country_flag': player['country_flag'],
-                    'country_name': player['country_name'],
-                }
-            else:
-                # Shouldn't happen, but just in case
-                all_player_stats[name_key]['goals'] += player['goals']
-                all_player_stats[name_key]['assists'] += player['assists']
+    for country, players in zip(olympic_countries, country_players):
+        country_flag = COUNTRY_FLAGS.get(country, '')
+        country_name = COUNTRY_NAMES.get(country, country.title())
+        # Keyed by normalized name; a player only appears on one Olympic team,
+        # so each country's rows can be merged in a single update
+        all_player_stats.update({
+            name_key: {
+                'name': name,
+                'goals': goals,
+                'assists': assists,
+                'country': country,
+                'country_flag': country_flag,
+                'country_name': country_name,
+            }
+            for name_key, name, goals, assists in players
+        })
     
     print(f"\nTotal unique players with points: {len(all_player_stats)}")
     
-    # Step 2: Fetch NHL rosters
-    player_to_team = fetch_nhl_rosters()
+    # Step 2: Map NHL roster names to teams
+    print("\nNHL rosters:")
+    player_to_team = _build_player_to_team(rosters)
     
     # Step 3: Aggregate by NHL team
     print("\nAggregating points by NHL team...")
-    nhl_team_stats = defaultdict(lambda: {
-        'points': 0,
-        'goals': 0,
-        'assists': 0,
-        'players': []
-    })
+    nhl_team_stats = {
+        team: {'points': 0, 'goals': 0, 'assists': 0, 'players': []}
+        for team in NHL_TEAMS
+    }
     
     unmatched_players = []
     
@@ -420,10 +532,11 @@ def main():
         
         if nhl_team:
             points = stats['goals'] + stats['assists']
-            nhl_team_stats[nhl_team]['points'] += points
-            nhl_team_stats[nhl_team]['goals'] += stats['goals']
-            nhl_team_stats[nhl_team]['assists'] += stats['assists']
-            nhl_team_stats[nhl_team]['players'].append({
+            team_stats = nhl_team_stats[nhl_team]
+            team_stats['points'] += points
+            team_stats['goals'] += stats['goals']
+            team_stats['assists'] += stats['assists']
+            team_stats['players'].append({
                 'name': stats['name'],
                 'goals': stats['goals'],
                 'assists': stats['assists'],
@@ -438,14 +551,18 @@ def main():
                 'assists': stats['assists']
             })
     
+    # Sort each team's players once by points (descending), then goals; reused for display and HTML
+    for stats in nhl_team_stats.values():
+        stats['players'].sort(key=lambda p: (p['points'], p['goals']), reverse=True)
+    
     # Step 4: Display results
     print("\n" + "=" * 70)
     print("NHL TEAM RANKINGS BY OLYMPIC POINTS")
     print("=" * 70)
     
-    # Sort teams by points (descending), then by goals (descending) as tiebreaker
+    # Sort teams with at least one player by points (descending), then by goals (descending) as tiebreaker
     sorted_teams = sorted(
-        nhl_team_stats.items(),
+        ((team, stats) for team, stats in nhl_team_stats.items() if stats['players']),
         key=lambda x: (x[1]['points'], x[1]['goals']),
         reverse=True
     )
@@ -460,8 +577,7 @@ def main():
             print(f"{rank:<6} {team:<6} {stats['points']:<8} {stats['goals']:<8} {stats['assists']:<8} {len(stats['players']):<8}")
             
             # Show top contributors for this team
-            top_players = sorted(stats['players'], key=lambda x: x['points'], reverse=True)[:3]
-            for player in top_players:
+            for player in stats['players'][:3]:
                 print(f"         └─ {player['name']}: {player['goals']}G + {player['assists']}A = {player['points']}P")
         
         print("\n" + "=" * 70)
@@ -476,159 +592,174 @@ def main():
     generate_html(sorted_teams, len(all_player_stats), len(unmatched_players))
 
 
-def generate_html(sorted_teams, total_players, unmatched_count):
-    """Generate a static HTML website with sortable table and accordions."""
-    
-    html_content = f"""<!DOCTYPE html>
+# Page template, compiled once at import. Autoescaping keeps player names from injecting markup.
+RANKINGS_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>2026 Olympics - NHL Team Rankings</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             padding: 20px;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             border-radius: 12px;
             box-shadow: 0 20px 60px rgba(0,0,0,0.3);
             overflow: hidden;
-        }}
+        }
         
-        .header {{
+        .header {
             background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
             color: white;
             padding: 40px;
             text-align: center;
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 2.5em;
             margin-bottom: 10px;
             font-weight: 700;
-        }}
+        }
         
-        .header p {{
+        .header p {
             font-size: 1.1em;
             opacity: 0.9;
-        }}
+        }
         
-        .stats-summary {{
+        .stats-summary {
             display: flex;
             justify-content: space-around;
             padding: 30px;
             background: #f8f9fa;
             border-bottom: 1px solid #dee2e6;
-        }}
+        }
         
-        .stat-box {{
+        .stat-box {
             text-align: center;
-        }}
+        }
         
-        .stat-box .number {{
+        .stat-box .number {
             font-size: 2.5em;
             font-weight: bold;
             color: #2a5298;
-        }}
+        }
         
-        .stat-box .label {{
+        .stat-box .label {
             color: #6c757d;
             margin-top: 5px;
             font-size: 0.9em;
-        }}
+        }
         
-        .table-container {{
+        .table-container {
             padding: 20px 40px 40px;
             overflow-x: auto;
-        }}
+        }
         
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 20px;
-        }}
+        }
         
-        thead {{
+        thead {
             background: #2a5298;
             color: white;
-        }}
+        }
         
-        th {{
+        th {
             padding: 15px;
             text-align: left;
             font-weight: 600;
             cursor: pointer;
             user-select: none;
             position: relative;
-        }}
+        }
         
-        th:hover {{
+        th:hover {
             background: #1e3c72;
-        }}
+        }
         
-        th.sortable::after {{
+        th.sortable::after {
             content: ' ⇅';
             opacity: 0.5;
             font-size: 0.8em;
-        }}
+        }
         
-        th.sorted-asc::after {{
+        /* The table carries the current sort, so a re-sort only rewrites two attributes */
+{% for column in ('team', 'points', 'goals', 'assists', 'players') %}
+        table[data-sort-col="{{ column }}"][data-sort-dir="asc"] th[data-sort="{{ column }}"]::after {
             content: ' ▲';
             opacity: 1;
-        }}
+        }
         
-        th.sorted-desc::after {{
+        table[data-sort-col="{{ column }}"][data-sort-dir="desc"] th[data-sort="{{ column }}"]::after {
             content: ' ▼';
             opacity: 1;
-        }}
+        }
+        
+{% endfor %}
         
-        tbody tr {{
+        tbody tr {
             border-bottom: 1px solid #dee2e6;
             transition: background-color 0.2s;
-        }}
+        }
         
-        tbody tr:hover {{
+        tbody tr:hover {
             background-color: #f8f9fa;
-        }}
+        }
         
-        td {{
+        td {
             padding: 15px;
-        }}
+        }
         
-        .rank {{
+        .rank {
             font-weight: bold;
             color: #2a5298;
             font-size: 1.1em;
-        }}
+        }
         
-        .team-name {{
+        /* Rank numbers and medals follow each team group's position, so re-sorting needs no rank writes */
+        table {
+            counter-reset: rank;
+        }
+        
+        tbody.team-group {
+            counter-increment: rank;
+        }
+        
+        td.rank::after {
+            content: counter(rank);
+        }
+        
+        .team-name {
             font-weight: 600;
             font-size: 1.05em;
             display: flex;
             align-items: center;
             gap: 10px;
-        }}
+        }
         
-        .team-logo {{
+        .team-logo {
             width: 32px;
             height: 32px;
             object-fit: contain;
-        }}
+        }
         
-        .expand-btn {{
+        .expand-btn {
             background: #2a5298;
             color: white;
             border: none;
@@ -637,121 +768,125 @@ def generate_html(sorted_teams, total_players, unmatched_count):
             cursor: pointer;
             font-size: 0.9em;
             transition: background-color 0.2s;
-        }}
+        }
         
-        .expand-btn:hover {{
+        .expand-btn:hover {
             background: #1e3c72;
-        }}
+        }
         
-        .accordion-content {{
+        .accordion-content {
             display: none;
             padding: 20px;
             background: #f8f9fa;
             border-left: 3px solid #2a5298;
             margin: 10px 0;
-        }}
+        }
         
-        .accordion-header {{
+        .accordion-header {
             display: flex;
             align-items: center;
             gap: 12px;
             margin-bottom: 15px;
-        }}
+        }
         
-        .accordion-header .team-logo {{
+        .accordion-header .team-logo {
             width: 40px;
             height: 40px;
-        }}
+        }
         
-        .accordion-header h3 {{
+        .accordion-header h3 {
             margin: 0;
-        }}
+        }
         
-        .accordion-content.active {{
+        .accordion-content.active {
             display: block;
             animation: slideDown 0.3s ease-out;
-        }}
+        }
         
-        @keyframes slideDown {{
-            from {{
+        @keyframes slideDown {
+            from {
                 opacity: 0;
                 max-height: 0;
-            }}
-            to {{
+            }
+            to {
                 opacity: 1;
                 max-height: 500px;
-            }}
-        }}
+            }
+        }
         
-        .player-list {{
+        .player-list {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(250px, 1fr));
             gap: 15px;
             margin-top: 10px;
-        }}
+        }
         
-        .player-card {{
+        .player-card {
             background: white;
             padding: 15px;
             border-radius: 6px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
+            /* Skip layout and paint for cards scrolled off-screen in an open accordion */
+            content-visibility: auto;
+            contain-intrinsic-size: auto 96px;
+        }
         
-        .player-name {{
+        .player-name {
             font-weight: 600;
             color: #1e3c72;
             margin-bottom: 8px;
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
         
-        .country-flag {{
+        .country-flag {
             font-size: 1.3em;
-        }}
+        }
         
-        .player-stats {{
+        .player-stats {
             display: flex;
             justify-content: space-between;
             font-size: 0.9em;
             color: #6c757d;
-        }}
+        }
         
-        .stat {{
+        .stat {
             display: flex;
             flex-direction: column;
             align-items: center;
-        }}
+        }
         
-        .stat-value {{
+        .stat-value {
             font-weight: bold;
             color: #2a5298;
             font-size: 1.2em;
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             font-size: 0.8em;
-        }}
+        }
         
-        .footer {{
+        .footer {
             text-align: center;
             padding: 20px;
             background: #f8f9fa;
             color: #6c757d;
             font-size: 0.9em;
-        }}
+        }
         
-        .medal {{
+        tbody.team-group:nth-of-type(-n+3) td.rank::before {
+            content: '';
             display: inline-block;
             width: 20px;
             height: 20px;
             border-radius: 50%;
             margin-right: 5px;
-        }}
+        }
         
-        .medal-1 {{ background: linear-gradient(135deg, #FFD700, #FFA500); }}
-        .medal-2 {{ background: linear-gradient(135deg, #C0C0C0, #808080); }}
-        .medal-3 {{ background: linear-gradient(135deg, #CD7F32, #8B4513); }}
+        tbody.team-group:nth-of-type(1) td.rank::before { background: linear-gradient(135deg, #FFD700, #FFA500); }
+        tbody.team-group:nth-of-type(2) td.rank::before { background: linear-gradient(135deg, #C0C0C0, #808080); }
+        tbody.team-group:nth-of-type(3) td.rank::before { background: linear-gradient(135deg, #CD7F32, #8B4513); }
     </style>
 </head>
 <body>
@@ -759,30 +894,30 @@ def generate_html(sorted_teams, total_players, unmatched_count):
         <div class="header">
             <h1>🏒 2026 Winter Olympics - NHL Team Rankings 🥇</h1>
             <p>Men's Ice Hockey - Points by NHL Team</p>
-            <p style="font-size: 0.9em; margin-top: 10px; opacity: 0.8;">Updated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
+            <p style="font-size: 0.9em; margin-top: 10px; opacity: 0.8;">Updated: {{ generated_at.strftime('%B %d, %Y at %I:%M %p') }}</p>
         </div>
         
         <div class="stats-summary">
             <div class="stat-box">
-                <div class="number">{len(sorted_teams)}</div>
+                <div class="number">{{ sorted_teams|length }}</div>
                 <div class="label">NHL Teams</div>
             </div>
             <div class="stat-box">
-                <div class="number">{sum(len(stats['players']) for _, stats in sorted_teams)}</div>
+                <div class="number">{{ total_nhl_players }}</div>
                 <div class="label">NHL Players</div>
             </div>
             <div class="stat-box">
-                <div class="number">{sum(stats['points'] for _, stats in sorted_teams)}</div>
+                <div class="number">{{ total_points }}</div>
                 <div class="label">Total Points</div>
             </div>
             <div class="stat-box">
-                <div class="number">{total_players}</div>
+                <div class="number">{{ total_players }}</div>
                 <div class="label">All Olympic Players</div>
             </div>
         </div>
         
         <div class="table-container">
-            <table id="rankingsTable">
+            <table id="rankingsTable" data-sort-col="points" data-sort-dir="desc">
                 <thead>
                     <tr>
                         <th>Rank</th>
@@ -794,194 +929,229 @@ def generate_html(sorted_teams, total_players, unmatched_count):
                         <th>Details</th>
                     </tr>
                 </thead>
-                <tbody>
-"""
-    
-    for rank, (team, stats) in enumerate(sorted_teams, 1):
-        medal_html = ''
-        if rank == 1:
-            medal_html = '<span class="medal medal-1"></span>'
-        elif rank == 2:
-            medal_html = '<span class="medal medal-2"></span>'
-        elif rank == 3:
-            medal_html = '<span class="medal medal-3"></span>'
-        
-        logo_url = f"https://assets.nhle.com/logos/nhl/svg/{team}_light.svg"
-        
-        html_content += f"""
-                    <tr data-team="{team}" data-points="{stats['points']}" data-goals="{stats['goals']}" data-assists="{stats['assists']}" data-players="{len(stats['players'])}">
-                        <td class="rank">{medal_html}{rank}</td>
+{# One tbody per team keeps each team row and its accordion together, so sorting moves whole groups #}
+{% for team, stats in sorted_teams %}
+{% set logo_url = 'https://assets.nhle.com/logos/nhl/svg/' ~ team ~ '_light.svg' %}
+
+                <tbody class="team-group" data-team="{{ team }}" data-points="{{ stats.points }}" data-goals="{{ stats.goals }}" data-assists="{{ stats.assists }}" data-players="{{ stats.players|length }}">
+                    <tr class="main-row">
+                        <td class="rank"></td>
                         <td class="team-name">
-                            <img src="{logo_url}" alt="{team}" class="team-logo" onerror="this.style.display='none'">
-                            <span>{team}</span>
+                            <img src="{{ logo_url }}" alt="{{ team }}" class="team-logo" onerror="this.style.display='none'">
+                            <span>{{ team }}</span>
                         </td>
-                        <td>{stats['points']}</td>
-                        <td>{stats['goals']}</td>
-                        <td>{stats['assists']}</td>
-                        <td>{len(stats['players'])}</td>
-                        <td><button class="expand-btn" onclick="toggleAccordion('{team}')">Show Players</button></td>
+                        <td>{{ stats.points }}</td>
+                        <td>{{ stats.goals }}</td>
+                        <td>{{ stats.assists }}</td>
+                        <td>{{ stats.players|length }}</td>
+                        <td><button class="expand-btn" onclick="toggleAccordion('{{ team }}')">Show Players</button></td>
                     </tr>
-                    <tr id="accordion-{team}" class="accordion-row">
+                    <tr id="accordion-{{ team }}" class="accordion-row">
                         <td colspan="7">
                             <div class="accordion-content">
                                 <div class="accordion-header">
-                                    <img src="{logo_url}" alt="{team}" class="team-logo" onerror="this.style.display='none'">
-                                    <h3>{team} Player Statistics</h3>
+                                    <img src="{{ logo_url }}" alt="{{ team }}" class="team-logo" onerror="this.style.display='none'">
+                                    <h3>{{ team }} Player Statistics</h3>
                                 </div>
                                 <div class="player-list">
-"""
-        
-        # Sort players by points (descending), then goals
-        sorted_players = sorted(stats['players'], key=lambda p: (p['points'], p['goals']), reverse=True)
-        
-        for player in sorted_players:
-            flag = player.get('country_flag', '')
-            country_name = player.get('country_name', '')
-            flag_title = f' title="{country_name}"' if country_name else ''
-            
-            html_content += f"""
+{# Players are already sorted by points (descending), then goals #}
+{% for player in stats.players %}
+
                                     <div class="player-card">
                                         <div class="player-name">
-                                            <span class="country-flag"{flag_title}>{flag}</span>
-                                            <span>{player['name']}</span>
+                                            <span class="country-flag"{% if player.country_name %} title="{{ player.country_name }}"{% endif %}>{{ player.country_flag }}</span>
+                                            <span>{{ player.name }}</span>
                                         </div>
                                         <div class="player-stats">
                                             <div class="stat">
-                                                <span class="stat-value">{player['goals']}</span>
+                                                <span class="stat-value">{{ player.goals }}</span>
                                                 <span class="stat-label">Goals</span>
                                             </div>
                                             <div class="stat">
-                                                <span class="stat-value">{player['assists']}</span>
+                                                <span class="stat-value">{{ player.assists }}</span>
                                                 <span class="stat-label">Assists</span>
                                             </div>
                                             <div class="stat">
-                                                <span class="stat-value">{player['points']}</span>
+                                                <span class="stat-value">{{ player.points }}</span>
                                                 <span class="stat-label">Points</span>
                                             </div>
                                         </div>
                                     </div>
-"""
-        
-        html_content += """
+{% endfor %}
+
                                 </div>
                             </div>
                         </td>
                     </tr>
-"""
-    
-    html_content += f"""
                 </tbody>
+{% endfor %}
             </table>
         </div>
         
         <div class="footer">
             <p>Data Sources: Quanthockey.com (Olympic Stats) • NHL API (Team Rosters)</p>
-            <p style="margin-top: 5px;">Note: {unmatched_count} players with points not on current NHL rosters</p>
+            <p style="margin-top: 5px;">Note: {{ unmatched_count }} players with points not on current NHL rosters</p>
         </div>
     </div>
     
     <script>
-        function toggleAccordion(team) {{
+        function toggleAccordion(team) {
             const accordion = document.getElementById('accordion-' + team);
             const content = accordion.querySelector('.accordion-content');
             const allAccordions = document.querySelectorAll('.accordion-content');
             
             // Close other accordions
-            allAccordions.forEach(acc => {{
-                if (acc !== content) {{
+            allAccordions.forEach(acc => {
+                if (acc !== content) {
                     acc.classList.remove('active');
-                }}
-            }});
+                }
+            });
             
             // Toggle current accordion
             content.classList.toggle('active');
-        }}
+        }
         
-        let currentSort = {{ column: null, direction: 'desc' }};
+        // Rows are rendered server-side already sorted by points (descending)
+        let currentSort = { column: 'points', direction: 'desc' };
         
-        function sortTable(column) {{
-            const table = document.getElementById('rankingsTable');
-            const tbody = table.querySelector('tbody');
-            const rows = Array.from(tbody.querySelectorAll('tr:not(.accordion-row)'));
-            
-            // Determine sort direction
-            if (currentSort.column === column) {{
+        // Team groups (team row + accordion row) never change after load, so collect them once
+        const rankingsTable = document.getElementById('rankingsTable');
+        const teamGroups = Array.from(rankingsTable.querySelectorAll('tbody.team-group'));
+        
+        // Parse every team group's sort keys once at load into parallel arrays indexed by group.
+        // The data never changes after load, so sorts only ever compare plain numbers.
+        function buildSortCache(groups) {
+            const n = groups.length;
+            const cache = {
+                groups: groups,
+                team: new Array(n),
+                teamOrder: new Int32Array(n),  // Alphabetical position of each group's team
+                points: new Int32Array(n),
+                goals: new Int32Array(n),
+                assists: new Int32Array(n),
+                players: new Int32Array(n),
+                order: new Uint32Array(n),  // Group indices in current display order
+            };
+            groups.forEach((group, i) => {
+                cache.team[i] = group.getAttribute('data-team');
+                cache.points[i] = parseInt(group.getAttribute('data-points'), 10);
+                cache.goals[i] = parseInt(group.getAttribute('data-goals'), 10);
+                cache.assists[i] = parseInt(group.getAttribute('data-assists'), 10);
+                cache.players[i] = parseInt(group.getAttribute('data-players'), 10);
+                cache.order[i] = i;
+            });
+            // Rank the team names once so team sorts compare integers instead of calling localeCompare
+            Array.from(cache.order)
+                .sort((a, b) => cache.team[a].localeCompare(cache.team[b]))
+                .forEach((groupIndex, position) => { cache.teamOrder[groupIndex] = position; });
+            return cache;
+        }
+        
+        const sortCache = buildSortCache(teamGroups);
+        
+        // Generated comparators over group indices, keyed by 'column|direction'
+        const cmpCache = new Map();
+        
+        // Build a straight-line comparator for the column and direction once, with the
+        // cached key arrays bound as arguments, so each comparison is just typed-array reads
+        function getComparator(cache, column, direction) {
+            const key = column + '|' + direction;
+            let cmp = cmpCache.get(key);
+            if (!cmp) {
+                const [x, y] = direction === 'asc' ? ['a', 'b'] : ['b', 'a'];
+                let expr = `values[${x}] - values[${y}]`;
+                if (column === 'points' && direction === 'desc') {
+                    // For descending, use goals as tiebreaker for points
+                    expr += ' || goals[b] - goals[a]';
+                }
+                const values = column === 'team' ? cache.teamOrder : cache[column];
+                cmp = new Function('values', 'goals', `return (a, b) => ${expr};`)(values, cache.goals);
+                cmpCache.set(key, cmp);
+            }
+            return cmp;
+        }
+        
+        // Sort currently shown in the DOM; currentSort is the one last requested by a click
+        const renderedSort = { column: currentSort.column, direction: currentSort.direction };
+        let sortFrame = 0;
+        
+        // Record the requested sort and re-sort at most once per frame,
+        // so rapid clicks only pay for the state that actually gets painted
+        function requestSort(column) {
+            if (currentSort.column === column) {
                 currentSort.direction = currentSort.direction === 'asc' ? 'desc' : 'asc';
-            }} else {{
+            } else {
                 currentSort.column = column;
                 currentSort.direction = 'desc';
-            }}
+            }
+            if (!sortFrame) {
+                sortFrame = requestAnimationFrame(() => {
+                    sortFrame = 0;
+                    sortTable();
+                });
+            }
+        }
+        
+        function sortTable() {
+            const { column, direction } = currentSort;
+            const sameColumn = renderedSort.column === column;
+            if (sameColumn && renderedSort.direction === direction) return;
             
-            // Sort rows
-            rows.sort((a, b) => {{
-                let aVal, bVal;
-                
-                if (column === 'team') {{
-                    aVal = a.dataset.team;
-                    bVal = b.dataset.team;
-                    return currentSort.direction === 'asc' 
-                        ? aVal.localeCompare(bVal)
-                        : bVal.localeCompare(aVal);
-                }} else {{
-                    aVal = parseInt(a.dataset[column]);
-                    bVal = parseInt(b.dataset[column]);
-                    
-                    if (currentSort.direction === 'asc') {{
-                        return aVal - bVal;
-                    }} else {{
-                        // For descending, use goals as tiebreaker for points
-                        if (column === 'points' && aVal === bVal) {{
-                            return parseInt(b.dataset.goals) - parseInt(a.dataset.goals);
-                        }}
-                        return bVal - aVal;
-                    }}
-                }}
-            }});
+            const cache = sortCache;
             
-            // Clear existing rows
-            const allRows = tbody.querySelectorAll('tr');
-            allRows.forEach(row => row.remove());
+            // Sort group indices in place, starting from the current order so ties keep their relative position.
+            // Only flipping the direction of the shown column just reverses the current order,
+            // except for points, whose goals tiebreaker stays descending.
+            const order = cache.order;
+            if (sameColumn && column !== 'points') {
+                order.reverse();
+            } else {
+                order.sort(getComparator(cache, column, direction));
+            }
             
-            // Re-insert sorted rows with their accordions
-            rows.forEach((row, index) => {{
-                const team = row.dataset.team;
-                const accordionRow = document.getElementById('accordion-' + team);
-                
-                // Update rank
-                const rankCell = row.querySelector('.rank');
-                const currentRank = index + 1;
-                let medalHtml = '';
-                if (currentRank === 1) medalHtml = '<span class="medal medal-1"></span>';
-                else if (currentRank === 2) medalHtml = '<span class="medal medal-2"></span>';
-                else if (currentRank === 3) medalHtml = '<span class="medal medal-3"></span>';
-                rankCell.innerHTML = medalHtml + currentRank;
-                
-                tbody.appendChild(row);
-                tbody.appendChild(accordionRow);
-            }});
+            // Move the team groups into a fragment in sorted order, then append them after the thead in one go
+            const frag = document.createDocumentFragment();
+            order.forEach(groupIndex => frag.appendChild(cache.groups[groupIndex]));
+            rankingsTable.appendChild(frag);
+            
+            // Header arrows are drawn by CSS from the table's sort attributes
+            rankingsTable.dataset.sortCol = column;
+            rankingsTable.dataset.sortDir = direction;
             
-            // Update header indicators
-            document.querySelectorAll('th').forEach(th => {{
-                th.classList.remove('sorted-asc', 'sorted-desc');
-                if (th.dataset.sort === column) {{
-                    th.classList.add('sorted-' + currentSort.direction);
-                }}
-            }});
-        }}
+            renderedSort.column = column;
+            renderedSort.direction = direction;
+        }
         
         // Add click handlers to sortable headers
-        document.querySelectorAll('th.sortable').forEach(th => {{
-            th.addEventListener('click', () => {{
-                sortTable(th.dataset.sort);
-            }});
-        }});
-        
-        // Set initial sort state
-        document.querySelector('th[data-sort="points"]').classList.add('sorted-desc');
+        document.querySelectorAll('th.sortable').forEach(th => {
+            th.addEventListener('click', () => {
+                requestSort(th.dataset.sort);
+            });
+        });
     </script>
 </body>
 </html>
 """
+
+_TEMPLATE = jinja2.Environment(
+    autoescape=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+).from_string(RANKINGS_TEMPLATE)
+
+
+def generate_html(sorted_teams, total_players, unmatched_count):
+    """Generate a static HTML website with sortable table and accordions."""
+    
+    html_content = _TEMPLATE.render(
+        sorted_teams=sorted_teams,
+        total_nhl_players=sum(len(stats['players']) for _, stats in sorted_teams),
+        total_points=sum(stats['points'] for _, stats in sorted_teams),
+        total_players=total_players,
+        unmatched_count=unmatched_count,
+        generated_at=datetime.now(),
+    )
     
     # Write to file
     output_file = 'olympics_nhl_rankings.html'